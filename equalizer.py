@@ -8,16 +8,26 @@ Run with --dry-run first to review the eviction plan before applying it.
 """
 
 import argparse
+import array
+import concurrent.futures
 import datetime
+import decimal
+import heapq
+import itertools
+import json
 import sys
+import threading
+import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
 except ImportError as _IMPORT_ERROR:  # pragma: no cover - runtime guardrail
     client = None  # type: ignore[assignment]
     config = None  # type: ignore[assignment]
+    watch = None  # type: ignore[assignment]
 else:
     _IMPORT_ERROR = None
 
@@ -59,6 +69,18 @@ else:  # pragma: no cover - fallback path
     _HAS_RICH = False
 
 
+_POD_PAGE_SIZE = 500
+_EVICTION_WORKERS = 8
+_WATCH_TIMEOUT_SECONDS = 300
+_WATCH_RETRY_SECONDS = 5
+# Let the apiserver drop pods that are not bound to a node yet.
+_BOUND_POD_FIELD_SELECTOR = "spec.nodeName!="
+_UTC = datetime.timezone.utc
+_EVICTABLE_PHASES = frozenset(("Pending", "Running"))
+_MIRROR_POD_ANNOTATION = "kubernetes.io/config.mirror"
+_SAFE_TO_EVICT_ANNOTATION = "cluster-autoscaler.kubernetes.io/safe-to-evict"
+
+
 def _print_info(message: str) -> None:
     if STDOUT_CONSOLE is not None:
         STDOUT_CONSOLE.print(message)
@@ -126,14 +148,39 @@ def parse_args() -> argparse.Namespace:
         "--max-evictions",
         type=int,
         default=None,
-        help="Upper bound on number of evictions performed in a single run.",
+        help=(
+            "Upper bound on number of evictions performed in a single run "
+            "(per round with --watch)."
+        ),
+    )
+    parser.add_argument(
+        "--assume-homogeneous",
+        action="store_true",
+        help="Split pods evenly across nodes instead of by allocatable CPU.",
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Plan balancing actions without evicting pods.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running, rebalancing every --interval seconds from a watched pod cache; "
+            "--max-evictions then applies to each round."
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=60,
+        help="Seconds between balancing rounds in --watch mode (default: %(default)s).",
+    )
+    args = parser.parse_args()
+    if args.interval < 1:
+        parser.error("--interval must be at least 1 second.")
+    return args
 
 
 def load_client(kubeconfig: Optional[str], context: Optional[str]):
@@ -155,77 +202,265 @@ def load_client(kubeconfig: Optional[str], context: Optional[str]):
     return client
 
 
+def create_api_client(client_module):
+    configuration = client_module.Configuration.get_default_copy()
+    # Keep a pooled connection per eviction worker; otherwise urllib3 drops
+    # the overflow and every extra request pays for a fresh TLS handshake.
+    configuration.connection_pool_maxsize = max(
+        configuration.connection_pool_maxsize or 0, _EVICTION_WORKERS
+    )
+    api_client = client_module.ApiClient(configuration)
+    # The Python client has no protobuf codec, so stay on JSON but ask the
+    # apiserver to gzip list responses, which shrinks them several-fold.
+    api_client.set_default_header("Accept", "application/json")
+    api_client.set_default_header("Accept-Encoding", "gzip")
+    return api_client
+
+
+def _read_json(response) -> dict:
+    # Responses are requested with _preload_content=False so the client skips
+    # building full V1Pod/V1Node models; we only decode the raw JSON once.
+    return json.loads(response.data)
+
+
+def _utc_timestamp(value: datetime.datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    return value.timestamp()
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return _utc_timestamp(datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ"))
+
+
+def _project_pod(raw: dict) -> dict:
+    """Reduce a raw pod object to the handful of fields the planner reads."""
+    metadata = raw.get("metadata") or {}
+    spec = raw.get("spec") or {}
+    status = raw.get("status") or {}
+    return {
+        "name": metadata.get("name"),
+        "namespace": metadata.get("namespace"),
+        "annotations": metadata.get("annotations") or {},
+        "owner_references": metadata.get("ownerReferences") or [],
+        "node_name": spec.get("nodeName"),
+        "priority": spec.get("priority"),
+        "phase": status.get("phase"),
+        "start_ts": _parse_timestamp(status.get("startTime")),
+    }
+
+
+def _parse_cpu_millicores(quantity: Optional[str]) -> int:
+    if not quantity:
+        return 0
+    try:
+        if quantity.endswith("m"):
+            return int(quantity[:-1])
+        return int(decimal.Decimal(quantity) * 1000)
+    except (ValueError, decimal.InvalidOperation):
+        return 0
+
+
 def list_schedulable_nodes(
     core_api,
     selector: Optional[str],
-) -> Sequence[str]:
-    nodes = core_api.list_node(label_selector=selector).items
-    filtered = [
-        node.metadata.name
+) -> Tuple[List[str], array.array]:
+    """Return schedulable node names (sorted) and their allocatable CPU in millicores."""
+    nodes = _read_json(
+        core_api.list_node(label_selector=selector, _preload_content=False)
+    ).get("items") or []
+    filtered = sorted(
+        (
+            node["metadata"]["name"],
+            _parse_cpu_millicores(
+                ((node.get("status") or {}).get("allocatable") or {}).get("cpu")
+            ),
+        )
         for node in nodes
-        if not getattr(node.spec, "unschedulable", False)
-    ]
+        if not (node.get("spec") or {}).get("unschedulable", False)
+    )
     if not filtered:
         raise SystemExit("No schedulable nodes match the provided filters.")
-    return sorted(filtered)
+    names = [name for name, _ in filtered]
+    cpu_millicores = array.array("q", (cpu for _, cpu in filtered))
+    return names, cpu_millicores
+
+
+def _iter_pod_pages(core_api, namespace: str, selector: Optional[str]):
+    # Read from the apiserver watch cache (resourceVersion=0, NotOlderThan)
+    # rather than doing a quorum read from etcd. Most apiservers ignore limit
+    # for such reads and return the whole namespace in one response; the
+    # continue loop only matters on servers that can page from the cache.
+    options = {
+        "resource_version": "0",
+        "resource_version_match": "NotOlderThan",
+    }
+    while True:
+        payload = _read_json(
+            core_api.list_namespaced_pod(
+                namespace=namespace,
+                label_selector=selector,
+                field_selector=_BOUND_POD_FIELD_SELECTOR,
+                limit=_POD_PAGE_SIZE,
+                _preload_content=False,
+                **options,
+            )
+        )
+        yield payload
+        token = (payload.get("metadata") or {}).get("continue")
+        if not token:
+            return
+        options = {"_continue": token}
 
 
-def list_target_pods(core_api, namespace: str, selector: Optional[str]):
-    pods = core_api.list_namespaced_pod(
-        namespace=namespace,
-        label_selector=selector,
-    ).items
-    return [pod for pod in pods if pod.spec.node_name]
+def iter_target_pods(core_api, namespace: str, selector: Optional[str]):
+    for payload in _iter_pod_pages(core_api, namespace, selector):
+        for raw in payload.get("items") or []:
+            yield _project_pod(raw)
+
+
+def _is_terminating(raw: dict) -> bool:
+    return bool((raw.get("metadata") or {}).get("deletionTimestamp"))
+
+
+class _PodCache:
+    """Local copy of the target pods, seeded by one LIST and kept current by a watch."""
 
+    def __init__(self, core_api, namespace: str, selector: Optional[str]):
+        self._core_api = core_api
+        self._namespace = namespace
+        self._selector = selector
+        self._pods: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._watch = watch.Watch()
+        self._resource_version: Optional[str] = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="pod-cache", daemon=True)
 
-def group_pods_by_node(pods) -> Dict[str, List]:
+    def start(self) -> None:
+        self._relist()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._watch.stop()
+
+    def snapshot(self) -> List[dict]:
+        if not self._thread.is_alive():
+            raise SystemExit(
+                "Pod watch stopped unexpectedly; refusing to balance from stale data."
+            )
+        with self._lock:
+            return list(self._pods.values())
+
+    def _relist(self) -> None:
+        pods: Dict[Tuple[str, str], dict] = {}
+        resource_version = None
+        for payload in _iter_pod_pages(self._core_api, self._namespace, self._selector):
+            resource_version = (payload.get("metadata") or {}).get("resourceVersion")
+            for raw in payload.get("items") or []:
+                if not _is_terminating(raw):
+                    pod = _project_pod(raw)
+                    pods[(pod["namespace"], pod["name"])] = pod
+        with self._lock:
+            self._pods = pods
+        self._resource_version = resource_version
+
+    def _run(self) -> None:
+        needs_relist = False
+        while not self._stopped:
+            try:
+                if needs_relist:
+                    self._relist()
+                    needs_relist = False
+                for event in self._watch.stream(
+                    self._core_api.list_namespaced_pod,
+                    namespace=self._namespace,
+                    label_selector=self._selector,
+                    field_selector=_BOUND_POD_FIELD_SELECTOR,
+                    resource_version=self._resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=_WATCH_TIMEOUT_SECONDS,
+                ):
+                    self._apply(event)
+                # The stream ends at timeout_seconds; resume where it stopped.
+                self._resource_version = self._watch.resource_version
+            except client.exceptions.ApiException as exc:
+                if exc.status == 410:
+                    # Our resourceVersion fell out of the watch window; relist
+                    # inside the try so a failed relist is retried, not fatal.
+                    needs_relist = True
+                    continue
+                _print_warning(f"Pod watch failed, retrying: {exc}")
+                time.sleep(_WATCH_RETRY_SECONDS)
+            except Exception as exc:  # pragma: no cover - defensive fallback
+                _print_warning(f"Pod watch interrupted, retrying: {exc}")
+                time.sleep(_WATCH_RETRY_SECONDS)
+
+    def _apply(self, event) -> None:
+        kind = event["type"]
+        if kind not in ("ADDED", "MODIFIED", "DELETED"):
+            return
+        raw = event["raw_object"]
+        pod = _project_pod(raw)
+        key = (pod["namespace"], pod["name"])
+        with self._lock:
+            # Drop pods once they are marked for deletion so the next round
+            # does not plan evictions the previous one already made.
+            if kind == "DELETED" or _is_terminating(raw):
+                self._pods.pop(key, None)
+            else:
+                self._pods[key] = pod
+
+
+def group_pods_by_node(pods) -> Tuple[Dict[str, List], Dict[str, List]]:
+    """Group bound pods by node and collect keyed eviction candidates in one pass."""
     grouped: Dict[str, List] = defaultdict(list)
+    evictable: Dict[str, List] = defaultdict(list)
     for pod in pods:
-        grouped[pod.spec.node_name].append(pod)
-    return grouped
+        node = pod["node_name"]
+        grouped[node].append(pod)
+        if _is_evictable(pod):
+            # Store the sort key next to the pod so ranking compares plain
+            # tuples; the per-node position keeps ties in listing order.
+            candidates = evictable[node]
+            candidates.append(_pod_sort_key(pod) + (len(candidates), pod))
+    return grouped, evictable
 
 
-def _is_managed_by_daemonset(pod) -> bool:
-    for owner in pod.metadata.owner_references or []:
-        if owner.kind == "DaemonSet":
-            return True
-    return False
+def _is_managed_by_daemonset(owner_references) -> bool:
+    return any(owner.get("kind") == "DaemonSet" for owner in owner_references)
 
 
 def _is_evictable(pod) -> bool:
-    annotations = pod.metadata.annotations or {}
-    if annotations.get("kubernetes.io/config.mirror"):
+    annotations = pod["annotations"]
+    if annotations.get(_MIRROR_POD_ANNOTATION):
         return False
-    if annotations.get("cluster-autoscaler.kubernetes.io/safe-to-evict") == "false":
+    if annotations.get(_SAFE_TO_EVICT_ANNOTATION) == "false":
         return False
-    if _is_managed_by_daemonset(pod):
+    if _is_managed_by_daemonset(pod["owner_references"]):
         return False
-    if pod.status.phase not in {"Pending", "Running"}:
+    if pod["phase"] not in _EVICTABLE_PHASES:
         return False
     return True
 
 
 def _pod_sort_key(pod):
-    priority = pod.spec.priority if pod.spec.priority is not None else 0
+    priority = pod["priority"] if pod["priority"] is not None else 0
     # Evict the newest pods first to reduce impact on long-running workloads.
-    start_time = pod.status.start_time
-    if start_time is None:
+    start_ts = pod["start_ts"]
+    if start_ts is None:
         start_ts = float("inf")
-    else:
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=datetime.timezone.utc)
-        start_ts = start_time.timestamp()
     return (priority, -start_ts)
 
 
-def _format_pod_age(pod) -> str:
-    start_time = getattr(pod.status, "start_time", None)
-    if start_time is None:
+def _format_pod_age(pod, now: float) -> str:
+    start_ts = pod["start_ts"]
+    if start_ts is None:
         return "n/a"
-    if start_time.tzinfo is None:
-        start_time = start_time.replace(tzinfo=datetime.timezone.utc)
-    delta = datetime.datetime.now(datetime.timezone.utc) - start_time
-    seconds_total = int(delta.total_seconds())
+    seconds_total = int(now - start_ts)
     if seconds_total <= 0:
         return "0s"
     minutes, seconds = divmod(seconds_total, 60)
@@ -240,34 +475,82 @@ def _format_pod_age(pod) -> str:
     return f"{seconds}s"
 
 
-def compute_targets(
+def index_by_node(
     nodes: Sequence[str],
     pods_by_node: Dict[str, Sequence],
-) -> Dict[str, int]:
-    counts = {node: len(pods_by_node.get(node, ())) for node in nodes}
-    total = sum(counts.values())
-    per_node, extra = divmod(total, len(nodes))
-    ranked_nodes = sorted(nodes, key=lambda name: counts[name], reverse=True)
-    targets = {node: per_node for node in nodes}
-    for idx in range(extra):
-        targets[ranked_nodes[idx]] += 1
+    evictable_by_node: Dict[str, List],
+) -> Tuple[array.array, List[List]]:
+    """Lay per-node load out as arrays aligned with ``nodes``."""
+    counts = array.array("i", (len(pods_by_node.get(node, ())) for node in nodes))
+    candidates = [evictable_by_node.get(node, []) for node in nodes]
+    return counts, candidates
+
+
+def compute_targets(
+    counts: Sequence[int],
+    weights: Optional[Sequence[int]] = None,
+) -> array.array:
+    """Split the total pod count across nodes in proportion to ``weights``."""
+    total = sum(counts)
+    # Equal weights (also used when a node reports no capacity) give an even split.
+    if not weights or not all(weights):
+        weights = [1] * len(counts)
+    weight_total = sum(weights)
+    shares = [divmod(total * weight, weight_total) for weight in weights]
+    # Keep a layout where every node already sits at the floor or ceiling of
+    # its share; moving pods would not make it any fairer.
+    if all(
+        floor <= count <= floor + (1 if remainder else 0)
+        for (floor, remainder), count in zip(shares, counts)
+    ):
+        return array.array("i", counts)
+    targets = array.array("i", (floor for floor, _ in shares))
+    extra = total - sum(targets)
+    # Leftover pods go to the largest fractional shares, then to higher-weight
+    # and busier nodes. A partial selection keeps the stable tie-break of a
+    # full descending sort.
+    ranked = heapq.nlargest(
+        extra,
+        range(len(counts)),
+        key=lambda idx: (shares[idx][1], weights[idx], counts[idx]),
+    )
+    for idx in ranked:
+        targets[idx] += 1
     return targets
 
 
+@dataclass
+class PlanBatch:
+    """Planned evictions stored column-wise, one entry per list index."""
+
+    # Indexes into the balanced node list.
+    nodes: List[int] = field(default_factory=list)
+    namespaces: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    pods: List[dict] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.pods)
+
+    def append(self, node_idx: int, pod: dict) -> None:
+        self.nodes.append(node_idx)
+        self.namespaces.append(pod["namespace"])
+        self.names.append(pod["name"])
+        self.pods.append(pod)
+
+
 def plan_evictions(
     nodes: Sequence[str],
-    pods_by_node: Dict[str, Sequence],
-    targets: Dict[str, int],
-) -> List:
-    plan = []
-    for node in nodes:
-        overload = len(pods_by_node.get(node, ())) - targets[node]
+    counts: Sequence[int],
+    candidates_by_node: Sequence[Sequence],
+    targets: Sequence[int],
+) -> PlanBatch:
+    plan = PlanBatch()
+    for idx, node in enumerate(nodes):
+        overload = counts[idx] - targets[idx]
         if overload <= 0:
             continue
-        candidates = sorted(
-            [pod for pod in pods_by_node.get(node, []) if _is_evictable(pod)],
-            key=_pod_sort_key,
-        )
+        candidates = candidates_by_node[idx]
         if len(candidates) < overload:
             shortage = overload - len(candidates)
             _print_warning(
@@ -276,11 +559,13 @@ def plan_evictions(
                 f"{shortage} pod(s) will remain imbalanced."
             )
             overload = len(candidates)
-        plan.extend((node, candidates[idx]) for idx in range(overload))
+        selected = heapq.nsmallest(overload, candidates)
+        for entry in selected:
+            plan.append(idx, entry[-1])
     return plan
 
 
-def print_plan(plan, targets, pods_by_node, nodes):
+def print_plan(plan, targets, counts, nodes):
     if not plan:
         if _HAS_RICH and STDOUT_CONSOLE is not None and Panel is not None and Text is not None:
             STDOUT_CONSOLE.rule(Text("Equalizer Status", style="title"))
@@ -302,25 +587,23 @@ def print_plan(plan, targets, pods_by_node, nodes):
         component is not None
         for component in (STDOUT_CONSOLE, Table, Panel, Text, box)
     ):
-        _render_rich_plan(plan, targets, pods_by_node, nodes)
+        _render_rich_plan(plan, targets, counts, nodes)
         return
 
     print("Planned evictions:")
-    for node, pod in plan:
-        current = len(pods_by_node.get(node, ()))
-        target = targets[node]
+    for node_idx, namespace, name in zip(plan.nodes, plan.namespaces, plan.names):
         print(
-            f"  - Evict {pod.metadata.namespace}/{pod.metadata.name} "
-            f"from {node} (current={current}, target={target})"
+            f"  - Evict {namespace}/{name} from {nodes[node_idx]} "
+            f"(current={counts[node_idx]}, target={targets[node_idx]})"
         )
 
 
-def _render_rich_plan(plan, targets, pods_by_node, nodes) -> None:
+def _render_rich_plan(plan, targets, counts, nodes) -> None:
     assert STDOUT_CONSOLE is not None  # for mypy
     assert Table is not None and Panel is not None and Text is not None and box is not None
 
     total_evictions = len(plan)
-    affected_nodes = sorted({node for node, _ in plan})
+    affected_nodes = set(plan.nodes)
 
     STDOUT_CONSOLE.rule(Text("Equalizer Eviction Plan ✨", style="title"))
 
@@ -352,27 +635,32 @@ def _render_rich_plan(plan, targets, pods_by_node, nodes) -> None:
     table.add_column("Load", style="value", no_wrap=True)
     table.add_column("Target", justify="right", style="value", no_wrap=True)
 
-    seen = defaultdict(int)
-    for node, pod in plan:
-        seen[node] += 1
-        current_total = len(pods_by_node.get(node, ()))
-        before = current_total - (seen[node] - 1)
-        after = max(before - 1, 0)
-        target = targets[node]
-        priority = getattr(pod.spec, "priority", None)
-        priority_text = "-" if priority is None else str(priority)
-        age_text = _format_pod_age(pod)
-        load_text = f"{before} → {after}"
-        target_style = "success" if after <= target else "warning"
-        target_text = f"[{target_style}]{target}[/]" if target_style else str(target)
-        table.add_row(
-            f"[value]{node}[/value]",
-            f"{pod.metadata.namespace}/{pod.metadata.name}",
-            priority_text,
-            age_text,
-            load_text,
-            target_text,
-        )
+    now = time.time()
+    # plan_evictions emits each node's evictions contiguously, so grouping
+    # without sorting keeps the rollout order.
+    rows = range(len(plan))
+    for node_idx, node_rows in itertools.groupby(rows, key=plan.nodes.__getitem__):
+        node = nodes[node_idx]
+        current_total = counts[node_idx]
+        target = targets[node_idx]
+        for idx, row in enumerate(node_rows):
+            pod = plan.pods[row]
+            before = current_total - idx
+            after = max(before - 1, 0)
+            priority = pod["priority"]
+            priority_text = "-" if priority is None else str(priority)
+            age_text = _format_pod_age(pod, now)
+            load_text = f"{before} → {after}"
+            target_style = "success" if after <= target else "warning"
+            target_text = f"[{target_style}]{target}[/]" if target_style else str(target)
+            table.add_row(
+                f"[value]{node}[/value]",
+                f"{plan.namespaces[row]}/{plan.names[row]}",
+                priority_text,
+                age_text,
+                load_text,
+                target_text,
+            )
 
     STDOUT_CONSOLE.print(table)
     STDOUT_CONSOLE.print(
@@ -466,78 +754,115 @@ def warn_on_unlisted_nodes(pods_by_node: Dict[str, Sequence], nodes: Sequence[st
 
 
 def execute_plan(
-    plan,
+    plan: PlanBatch,
     eviction_api,
     client_module,
     dry_run: bool,
     grace_period: Optional[int],
     max_evictions: Optional[int],
 ) -> int:
-    if not plan:
+    if not plan or dry_run:
         return 0
 
+    # The delete options are identical for every eviction; build them once.
+    delete_opts = client.V1DeleteOptions(grace_period_seconds=grace_period)
     performed = 0
-    for node, pod in plan:
-        if max_evictions is not None and performed >= max_evictions:
-            _print_warning("Reached --max-evictions limit, stopping.")
-            break
-        if dry_run:
-            continue
-        body = create_eviction_body(pod, grace_period)
-        try:
-            eviction_api.create_namespaced_pod_eviction(
-                name=pod.metadata.name,
-                namespace=pod.metadata.namespace,
-                body=body,
-            )
-            performed += 1
-        except client_module.exceptions.ApiException as exc:  # pragma: no cover
-            _print_error(
-                f"Failed to evict {pod.metadata.namespace}/{pod.metadata.name}: {exc}"
+    pending = iter(zip(plan.namespaces, plan.names))
+    in_flight: Dict[concurrent.futures.Future, Tuple[str, str]] = {}
+    workers = min(_EVICTION_WORKERS, len(plan))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # Never have more requests in flight than could still succeed
+            # under --max-evictions, so failures are replaced by later pods
+            # exactly as the sequential loop did.
+            while len(in_flight) < workers and (
+                max_evictions is None or performed + len(in_flight) < max_evictions
+            ):
+                entry = next(pending, None)
+                if entry is None:
+                    break
+                namespace, name = entry
+                future = executor.submit(
+                    _evict_pod, eviction_api, namespace, name, delete_opts
+                )
+                in_flight[future] = entry
+            if not in_flight:
+                break
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
             )
+            for future in done:
+                namespace, name = in_flight.pop(future)
+                try:
+                    future.result()
+                    performed += 1
+                except client_module.exceptions.ApiException as exc:  # pragma: no cover
+                    _print_error(f"Failed to evict {namespace}/{name}: {exc}")
+    if next(pending, None) is not None:
+        _print_warning("Reached --max-evictions limit, stopping.")
     return performed
 
 
-def create_eviction_body(pod, grace_period: Optional[int]):
-    delete_opts = client.V1DeleteOptions(
-        grace_period_seconds=grace_period,
+def _evict_pod(eviction_api, namespace: str, name: str, delete_opts) -> None:
+    eviction_api.create_namespaced_pod_eviction(
+        name=name,
+        namespace=namespace,
+        body=create_eviction_body(namespace, name, delete_opts),
     )
+
+
+def create_eviction_body(namespace: str, name: str, delete_opts):
     return client.V1Eviction(
         metadata=client.V1ObjectMeta(
-            name=pod.metadata.name,
-            namespace=pod.metadata.namespace,
+            name=name,
+            namespace=namespace,
         ),
         delete_options=delete_opts,
     )
 
 
-def main():
-    args = parse_args()
-    client = load_client(args.kubeconfig, args.context)
-    core_api = client.CoreV1Api()
-    nodes = list_schedulable_nodes(core_api, args.node_selector)
-    pods = list_target_pods(core_api, args.namespace, args.selector)
-    pods_by_node = group_pods_by_node(pods)
-    warn_on_unlisted_nodes(pods_by_node, nodes)
-    targets = compute_targets(nodes, pods_by_node)
-    plan = plan_evictions(nodes, pods_by_node, targets)
-    print_plan(plan, targets, pods_by_node, nodes)
-    print_node_distribution(nodes, pods_by_node)
-    if args.dry_run:
-        return 0
+def _resolve_eviction_api(client_module, core_api, api_client):
     eviction_api = core_api
-    policy_api_cls = getattr(client, "PolicyV1Api", None)
+    policy_api_cls = getattr(client_module, "PolicyV1Api", None)
     if policy_api_cls is not None:
         try:
-            candidate = policy_api_cls()
+            candidate = policy_api_cls(api_client)
             if hasattr(candidate, "create_namespaced_pod_eviction"):
                 eviction_api = candidate
         except Exception:  # pragma: no cover - defensive fallback
             pass
+    return eviction_api
+
+
+def balance(
+    args: argparse.Namespace,
+    client_module,
+    eviction_api,
+    nodes: Sequence[str],
+    capacities: Sequence[int],
+    pods_by_node: Dict[str, Sequence],
+    evictable_by_node: Dict[str, List],
+) -> None:
+    warn_on_unlisted_nodes(pods_by_node, nodes)
+    counts, candidates = index_by_node(nodes, pods_by_node, evictable_by_node)
+    weights = None if args.assume_homogeneous else capacities
+    if weights is not None:
+        missing = [node for node, cpu in zip(nodes, weights) if not cpu]
+        if missing:
+            _print_warning(
+                "No usable allocatable CPU reported by: "
+                f"{', '.join(missing)}. Falling back to an even split across nodes."
+            )
+    targets = compute_targets(counts, weights)
+    plan = plan_evictions(nodes, counts, candidates, targets)
+    print_plan(plan, targets, counts, nodes)
+    print_node_distribution(nodes, pods_by_node)
+    if args.dry_run:
+        return
     evicted = execute_plan(
         plan=plan,
         eviction_api=eviction_api,
-        client_module=client,
+        client_module=client_module,
         dry_run=args.dry_run,
         grace_period=args.grace_period,
         max_evictions=args.max_evictions,
@@ -546,6 +871,56 @@ def main():
         _print_success(f"Successfully issued {evicted} eviction request(s).")
     else:
         _print_info("No eviction requests were issued.")
+
+
+def run_watch(args: argparse.Namespace, client_module, core_api, eviction_api) -> int:
+    cache = _PodCache(core_api, args.namespace, args.selector)
+    cache.start()
+    try:
+        while True:
+            # A dead pod watch is fatal; any other failure only skips a round.
+            pods = cache.snapshot()
+            try:
+                nodes, capacities = list_schedulable_nodes(core_api, args.node_selector)
+                pods_by_node, evictable_by_node = group_pods_by_node(pods)
+                balance(
+                    args,
+                    client_module,
+                    eviction_api,
+                    nodes,
+                    capacities,
+                    pods_by_node,
+                    evictable_by_node,
+                )
+            except (Exception, SystemExit) as exc:
+                _print_warning(f"Balancing round failed, retrying in {args.interval}s: {exc}")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        cache.stop()
+
+
+def main():
+    args = parse_args()
+    client = load_client(args.kubeconfig, args.context)
+    api_client = create_api_client(client)
+    core_api = client.CoreV1Api(api_client)
+    eviction_api = _resolve_eviction_api(client, core_api, api_client)
+    if args.watch:
+        return run_watch(args, client, core_api, eviction_api)
+    # Node and pod listings are independent round trips; overlap them.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        nodes_future = executor.submit(
+            list_schedulable_nodes, core_api, args.node_selector
+        )
+        pods_future = executor.submit(
+            group_pods_by_node,
+            iter_target_pods(core_api, args.namespace, args.selector),
+        )
+        nodes, capacities = nodes_future.result()
+        pods_by_node, evictable_by_node = pods_future.result()
+    balance(args, client, eviction_api, nodes, capacities, pods_by_node, evictable_by_node)
     return 0
 
 